@@ -55,7 +55,7 @@ class BotBridge(metaclass=Singleton):
         self._cache_ttl = 5  # 缓存有效期（秒）
 
         # 存储正在运行的任务
-        self._tasks = []
+        self._tasks = set()
 
         # 初始化插件管理器
         self.plugin_manager = PluginManager()
@@ -183,12 +183,11 @@ class BotBridge(metaclass=Singleton):
     def _create_task(self, coro):
         loop = get_or_create_eventloop()
         task = loop.create_task(coro)
-        self._tasks.append(task)
+        self._tasks.add(task)
 
-        # 添加完成回调，完成后从列表移除
+        # 添加完成回调，完成后从集合移除
         def _done_callback(t):
-            if t in self._tasks:
-                self._tasks.remove(t)
+            self._tasks.discard(t)
 
             # 检查是否有异常
             if t.exception() is not None:
@@ -1,6 +1,7 @@
 import os
 import threading
 import time
+from collections import deque
 from pathlib import Path
 
 from flask_socketio import SocketIO, emit
@@ -152,12 +153,15 @@ class LogWatcher:
         """获取历史日志
         
         Args:
-            n: 要获取的日志行数，默认100行
+            n: 要获取的日志行数，默认100行，最多1000行
             
         Returns:
             list: 日志行列表
         """
         try:
+            # n来自客户端，先转换并限制范围，否则maxlen=None时会把整个日志读进内存
+            n = max(0, min(int(n), 1000))
+
             if isinstance(BOT_LOG_PATH, str):
                 log_path = Path(BOT_LOG_PATH)
             else:
@@ -167,12 +171,9 @@ class LogWatcher:
                 return []
 
             # 使用tail命令的逻辑，从文件末尾读取n行
+            # deque设置maxlen后会自动丢弃最早的行，避免把整个日志文件读入内存
             with open(log_path, 'r', encoding='utf-8') as f:
-                # 先获取所有行
-                all_lines = f.readlines()
-
-            # 获取最后n行
-            last_n_lines = all_lines[-n:] if len(all_lines) > n else all_lines
+                last_n_lines = deque(f, maxlen=n)
 
             # 过滤并处理日志行
             logs = [line.strip() for line in last_n_lines if line.strip()]
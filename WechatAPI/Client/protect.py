@@ -1,5 +1,6 @@
 import json
 import os
+import time
 from datetime import datetime
 
 
@@ -71,8 +72,7 @@ class Protect(metaclass=Singleton):
         Returns:
             bool: 如果当前时间与上次登录时间的差小于指定秒数，返回True；否则返回False
         """
-        now = datetime.now().timestamp()
-        return now - self.login_time < second
+        return time.time() - self.login_time < second
 
     def update_login_status(self, device_id: str = ""):
         """更新登录状态。
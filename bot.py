@@ -24,6 +24,7 @@ async def run_bot():
     """
     机器人主要运行逻辑
     """
+    xybot = None
 
     try:
         # 设置工作目录
@@ -195,6 +196,7 @@ async def run_bot():
         # 初始化机器人
         xybot = XYBot(bot)
         xybot.update_profile(bot.wxid, bot.nickname, bot.alias, bot.phone)
+        await xybot.initialize()
 
         # 启动调度器
         if scheduler.state == 0:
@@ -243,6 +245,8 @@ async def run_bot():
             await asyncio.sleep(0.5)
 
     except asyncio.CancelledError:
+        if xybot:
+            await xybot.close()
         await wechat_api_server.stop()
         logger.info("机器人关闭")
     except Exception as e:
@@ -2,6 +2,7 @@ import re
 import tomllib
 
 from WechatAPI import WechatAPIClient
+from utils.config_loader import load_toml
 from utils.decorators import *
 from utils.plugin_base import PluginBase
 
@@ -17,8 +18,7 @@ class BotStatus(PluginBase):
         with open("plugins/BotStatus/config.toml", "rb") as f:
             plugin_config = tomllib.load(f)
 
-        with open("main_config.toml", "rb") as f:
-            main_config = tomllib.load(f)
+        main_config = load_toml("main_config.toml")
 
         config = plugin_config["BotStatus"]
         main_config = main_config["XYBot"]
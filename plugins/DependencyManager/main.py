@@ -4,12 +4,13 @@
 作者: 老夏的金库
 版本: 1.2.0
 """
+import asyncio
 import importlib
 import io
+import locale
 import os
 import re
 import shutil
-import subprocess
 import sys
 import tempfile
 import tomllib
@@ -19,6 +20,7 @@ import requests
 from loguru import logger
 
 from WechatAPI import WechatAPIClient
+from utils.config_loader import load_toml
 from utils.decorators import *
 from utils.plugin_base import PluginBase
 
@@ -54,13 +56,18 @@ class DependencyManager(PluginBase):
         # 加载配置
         self.load_config()
 
+        # GitHub命令用来比较的字符串只拼接一次，不用每条消息都重新构建
+        self.github_prefix_lower = self.github_install_prefix.lower()
+        self.github_gemini_cmds = (f"{self.github_install_prefix} gemini",
+                                   f"{self.github_install_prefix} geminiimage")
+        self.github_help_cmd = f"{self.github_install_prefix} help"
+
         # logger.info(f"[DependencyManager] 插件初始化完成, 启用状态: {self.enable}, 优先级: 80")
 
     def load_config(self):
         """加载配置文件"""
         try:
-            with open("main_config.toml", "rb") as f:
-                config = tomllib.load(f)
+            config = load_toml("main_config.toml")
 
             self.admin_list = config.get("XYBot", {}).get("admins", [])
 
@@ -151,13 +158,13 @@ class DependencyManager(PluginBase):
         # 2. GitHub相关命令处理 - 优先级最高
 
         # 2.1 检查是否明确以GitHub前缀开头 - 要求明确的安装意图
-        starts_with_prefix = content.lower().startswith(self.github_install_prefix.lower())
-        logger.info(
-            f"[DependencyManager] 检查是否以'{self.github_install_prefix}'开头: {starts_with_prefix}, 内容: '{content}'")
+        content_lower = content.lower()
+        starts_with_prefix = content_lower.startswith(self.github_prefix_lower)
+        logger.debug("[DependencyManager] 检查是否以'{}'开头: {}, 内容: '{}'",
+                     self.github_install_prefix, starts_with_prefix, content)
 
         # 2.2 GitHub快捷命令 - GeminiImage特殊处理
-        if starts_with_prefix and (content.strip().lower() == f"{self.github_install_prefix} gemini" or
-                                   content.strip().lower() == f"{self.github_install_prefix} geminiimage"):
+        if starts_with_prefix and content_lower in self.github_gemini_cmds:
             logger.info("[DependencyManager] 检测到GeminiImage快捷安装命令")
             await bot.send_text_message(conversation_id, "🔄 正在安装GeminiImage插件...")
             await self._handle_github_install(bot, conversation_id, "https://github.com/NanSsye/GeminiImage.git")
@@ -165,7 +172,7 @@ class DependencyManager(PluginBase):
             return False
 
         # 2.3 GitHub帮助命令
-        if content.strip().lower() == f"{self.github_install_prefix} help":
+        if content_lower == self.github_help_cmd:
             help_text = f"""📦 GitHub插件安装帮助:
 
 1. 安装GitHub上的插件:
@@ -239,42 +246,42 @@ class DependencyManager(PluginBase):
         # 3.1 处理安装命令
         if content.startswith(self.install_cmd):
             await self._handle_install(bot, conversation_id, content.replace(self.install_cmd, "").strip())
-            logger.debug(f"[DependencyManager] 处理安装命令完成，阻止后续插件")
+            logger.debug("[DependencyManager] 处理安装命令完成，阻止后续插件")
             return False  # 命令已处理，不传递给其他插件
 
         # 3.2 处理查询命令
         elif content.startswith(self.show_cmd):
             await self._handle_show(bot, conversation_id, content.replace(self.show_cmd, "").strip())
-            logger.debug(f"[DependencyManager] 处理查询命令完成，阻止后续插件")
+            logger.debug("[DependencyManager] 处理查询命令完成，阻止后续插件")
             return False
 
         # 3.3 处理列表命令
         elif content.startswith(self.list_cmd):
             await self._handle_list(bot, conversation_id)
-            logger.debug(f"[DependencyManager] 处理列表命令完成，阻止后续插件")
+            logger.debug("[DependencyManager] 处理列表命令完成，阻止后续插件")
             return False
 
         # 3.4 处理卸载命令
         elif content.startswith(self.uninstall_cmd):
             await self._handle_uninstall(bot, conversation_id, content.replace(self.uninstall_cmd, "").strip())
-            logger.debug(f"[DependencyManager] 处理卸载命令完成，阻止后续插件")
+            logger.debug("[DependencyManager] 处理卸载命令完成，阻止后续插件")
             return False
 
         # 3.5 处理帮助命令
         elif content.strip() == "!pip help" or content.strip() == "!pip":
             await self._send_help(bot, conversation_id)
-            logger.debug(f"[DependencyManager] 处理帮助命令完成，阻止后续插件")
+            logger.debug("[DependencyManager] 处理帮助命令完成，阻止后续插件")
             return False
 
         # 3.6 处理导入检查命令
         elif content.startswith("!import"):
             package = content.replace("!import", "").strip()
             await self._check_import(bot, conversation_id, package)
-            logger.debug(f"[DependencyManager] 处理导入检查命令完成，阻止后续插件")
+            logger.debug("[DependencyManager] 处理导入检查命令完成，阻止后续插件")
             return False
 
         # 不是本插件的命令
-        logger.debug(f"[DependencyManager] 非依赖管理相关命令，允许其他插件处理")
+        logger.debug("[DependencyManager] 非依赖管理相关命令，允许其他插件处理")
         return True  # 不是命令，允许其他插件处理
 
     async def _handle_install(self, bot: WechatAPIClient, chat_id: str, package_spec: str):
@@ -293,15 +300,9 @@ class DependencyManager(PluginBase):
 
         try:
             # 执行pip安装命令
-            process = subprocess.Popen(
-                [sys.executable, "-m", "pip", "install", package_spec],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True
-            )
-            stdout, stderr = process.communicate()
-
-            if process.returncode == 0:
+            returncode, stdout, stderr = await self._run_command(sys.executable, "-m", "pip", "install", package_spec)
+
+            if returncode == 0:
                 # 安装成功
                 output = f"✅ 安装成功: {package_spec}\n\n{stdout}"
                 # 如果输出太长，只取前后部分
@@ -381,20 +382,14 @@ class DependencyManager(PluginBase):
                 # 尝试使用git更新现有插件
                 git_installed = self._check_git_installed()
                 if git_installed:
-                    os.chdir(plugin_target_dir)
                     logger.info(f"[DependencyManager] 执行git pull操作于: {plugin_target_dir}")
-                    process = subprocess.Popen(
-                        ["git", "pull", "origin", "main"],
-                        stdout=subprocess.PIPE,
-                        stderr=subprocess.PIPE,
-                        text=True
-                    )
-                    stdout, stderr = process.communicate()
-                    logger.info(f"[DependencyManager] Git pull结果：退出码 {process.returncode}")
+                    returncode, stdout, stderr = await self._run_command("git", "pull", "origin", "main",
+                                                                         cwd=plugin_target_dir)
+                    logger.info(f"[DependencyManager] Git pull结果：退出码 {returncode}")
                     logger.info(f"[DependencyManager] Stdout: {stdout}")
                     logger.info(f"[DependencyManager] Stderr: {stderr}")
 
-                    if process.returncode == 0:
+                    if returncode == 0:
                         await bot.send_text_message(chat_id, f"✅ 成功更新插件 {plugin_name}!\n\n{stdout}")
                         await self._install_plugin_requirements(bot, chat_id, plugin_target_dir)
                     else:
@@ -425,18 +420,12 @@ class DependencyManager(PluginBase):
                 if git_installed:
                     # 使用git克隆仓库
                     logger.info(f"[DependencyManager] 使用git克隆: {github_url}.git 到 {temp_dir}")
-                    process = subprocess.Popen(
-                        ["git", "clone", f"{github_url}.git", temp_dir],
-                        stdout=subprocess.PIPE,
-                        stderr=subprocess.PIPE,
-                        text=True
-                    )
-                    stdout, stderr = process.communicate()
-                    logger.info(f"[DependencyManager] Git clone结果：退出码 {process.returncode}")
+                    returncode, stdout, stderr = await self._run_command("git", "clone", f"{github_url}.git", temp_dir)
+                    logger.info(f"[DependencyManager] Git clone结果：退出码 {returncode}")
                     logger.info(f"[DependencyManager] Stdout: {stdout}")
                     logger.info(f"[DependencyManager] Stderr: {stderr}")
 
-                    if process.returncode != 0:
+                    if returncode != 0:
                         logger.error(f"[DependencyManager] Git克隆失败，尝试使用ZIP方式下载")
                         success = await self._download_github_zip(bot, chat_id, user_name, repo_name, temp_dir)
                         if not success:
@@ -472,19 +461,24 @@ class DependencyManager(PluginBase):
                 logger.exception(f"[DependencyManager] 安装插件时出错")
                 await bot.send_text_message(chat_id, f"❌ 安装插件时出错: {str(e)}")
 
-    def _check_git_installed(self):
-        """检查git命令是否可用"""
-        try:
-            process = subprocess.Popen(
-                ["git", "--version"],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True
-            )
-            process.communicate()
-            return process.returncode == 0
-        except Exception:
-            return False
+    @staticmethod
+    async def _run_command(*args, cwd: str = None) -> tuple[int, str, str]:
+        """异步执行命令，等待期间不阻塞事件循环"""
+        process = await asyncio.create_subprocess_exec(
+            *args,
+            cwd=cwd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+        stdout, stderr = await process.communicate()
+        # 和原来的text=True保持一致，按系统区域编码解码（Windows上通常是GBK）
+        encoding = locale.getpreferredencoding(False)
+        return process.returncode, stdout.decode(encoding, errors="replace"), stderr.decode(encoding, errors="replace")
+
+    @staticmethod
+    def _check_git_installed():
+        """检查git命令是否可用，直接在PATH中查找，不再启动子进程"""
+        return shutil.which("git") is not None
 
     async def _download_github_zip(self, bot, chat_id, user_name, repo_name, target_dir, is_update=False):
         """使用requests下载GitHub仓库的ZIP文件"""
@@ -599,15 +593,10 @@ class DependencyManager(PluginBase):
             await bot.send_text_message(chat_id, f"📋 依赖列表:\n{requirements}")
 
             # 安装依赖
-            process = subprocess.Popen(
-                [sys.executable, "-m", "pip", "install", "-r", requirements_file],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True
-            )
-            stdout, stderr = process.communicate()
-
-            if process.returncode == 0:
+            returncode, stdout, stderr = await self._run_command(sys.executable, "-m", "pip", "install", "-r",
+                                                                 requirements_file)
+
+            if returncode == 0:
                 output = f"✅ 依赖安装成功!\n\n{stdout}"
                 # 如果输出太长，只取前后部分
                 if len(output) > 1000:
@@ -634,15 +623,9 @@ class DependencyManager(PluginBase):
         await bot.send_text_message(chat_id, f"🔍 正在查询: {package}...")
 
         try:
-            process = subprocess.Popen(
-                [sys.executable, "-m", "pip", "show", package],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True
-            )
-            stdout, stderr = process.communicate()
-
-            if process.returncode == 0:
+            returncode, stdout, stderr = await self._run_command(sys.executable, "-m", "pip", "show", package)
+
+            if returncode == 0:
                 # 查询成功
                 await bot.send_text_message(chat_id, f"📋 {package} 信息:\n\n{stdout}")
             else:
@@ -657,15 +640,9 @@ class DependencyManager(PluginBase):
         await bot.send_text_message(chat_id, "📋 正在获取已安装的包列表...")
 
         try:
-            process = subprocess.Popen(
-                [sys.executable, "-m", "pip", "list"],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True
-            )
-            stdout, stderr = process.communicate()
-
-            if process.returncode == 0:
+            returncode, stdout, stderr = await self._run_command(sys.executable, "-m", "pip", "list")
+
+            if returncode == 0:
                 # 获取成功，但可能很长，分段发送
                 if len(stdout) > 1000:
                     chunks = [stdout[i:i + 1000] for i in range(0, len(stdout), 1000)]
@@ -691,15 +668,9 @@ class DependencyManager(PluginBase):
 
         try:
             # 使用-y参数自动确认卸载
-            process = subprocess.Popen(
-                [sys.executable, "-m", "pip", "uninstall", "-y", package],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True
-            )
-            stdout, stderr = process.communicate()
-
-            if process.returncode == 0:
+            returncode, stdout, stderr = await self._run_command(sys.executable, "-m", "pip", "uninstall", "-y", package)
+
+            if returncode == 0:
                 # 卸载成功
                 await bot.send_text_message(chat_id, f"✅ 卸载成功: {package}\n\n{stdout}")
             else:
@@ -9,6 +9,7 @@ from loguru import logger
 
 from WechatAPI import WechatAPIClient
 from database.XYBotDB import XYBotDB
+from utils.config_loader import load_toml
 from utils.decorators import *
 from utils.plugin_base import PluginBase
 
@@ -25,8 +26,7 @@ class Dify(PluginBase):
     def __init__(self):
         super().__init__()
 
-        with open("main_config.toml", "rb") as f:
-            config = tomllib.load(f)
+        config = load_toml("main_config.toml")
 
         self.admins = config["XYBot"]["admins"]
 
@@ -7,6 +7,7 @@ from loguru import logger
 from tabulate import tabulate
 
 from WechatAPI import WechatAPIClient
+from utils.config_loader import load_toml
 from utils.decorators import *
 from utils.plugin_base import PluginBase
 
@@ -22,8 +23,7 @@ class GetContact(PluginBase):
         with open("plugins/GetContact/config.toml", "rb") as f:
             plugin_config = tomllib.load(f)
 
-        with open("main_config.toml", "rb") as f:
-            main_config = tomllib.load(f)
+        main_config = load_toml("main_config.toml")
 
         config = plugin_config["GetContact"]
         main_config = main_config["XYBot"]
@@ -35,6 +35,10 @@ class Gomoku(PluginBase):
 
         self.db = XYBotDB()
 
+        # 棋盘底图只从磁盘读一次，每次绘制时复制一份
+        self.board_image = Image.open('resource/images/gomoku_board_original.png')
+        self.board_image.load()
+
         # 游戏状态存储
         self.gomoku_games = {}  # 存储所有进行中的游戏
         self.gomoku_players = {}  # 存储玩家与游戏的对应关系
@@ -298,7 +302,7 @@ class Gomoku(PluginBase):
 
     def _draw_board(self, game_id: str, highlight: tuple = None) -> str:
         """绘制棋盘并返回base64编码"""
-        board_img = Image.open('resource/images/gomoku_board_original.png')
+        board_img = self.board_image.copy()
         draw = ImageDraw.Draw(board_img)
 
         board = self.gomoku_games[game_id]['board']
@@ -4,6 +4,7 @@ from tabulate import tabulate
 
 from WechatAPI import WechatAPIClient
 from database.XYBotDB import XYBotDB
+from utils.config_loader import load_toml
 from utils.decorators import *
 from utils.plugin_base import PluginBase
 from utils.plugin_manager import PluginManager
@@ -22,8 +23,7 @@ class ManagePlugin(PluginBase):
         with open("plugins/ManagePlugin/config.toml", "rb") as f:
             plugin_config = tomllib.load(f)
 
-        with open("main_config.toml", "rb") as f:
-            main_config = tomllib.load(f)
+        main_config = load_toml("main_config.toml")
 
         plugin_config = plugin_config["ManagePlugin"]
         main_config = main_config["XYBot"]
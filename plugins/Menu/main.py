@@ -1,6 +1,7 @@
 import tomllib
 
 from WechatAPI import WechatAPIClient
+from utils.config_loader import load_toml
 from utils.decorators import *
 from utils.plugin_base import PluginBase
 
@@ -16,8 +17,7 @@ class Menu(PluginBase):
         with open("plugins/Menu/config.toml", "rb") as f:
             plugin_config = tomllib.load(f)
 
-        with open("main_config.toml", "rb") as f:
-            main_config = tomllib.load(f)
+        main_config = load_toml("main_config.toml")
 
         config = plugin_config["Menu"]
         main_config = main_config["XYBot"]
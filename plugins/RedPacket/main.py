@@ -3,6 +3,7 @@ import random
 import re
 import time
 import tomllib
+from collections import OrderedDict
 from io import BytesIO
 
 from PIL import Image, ImageDraw, ImageFilter
@@ -35,15 +36,22 @@ class RedPacket(PluginBase):
         self.max_packet = config["max-packet"]
         self.max_time = config["max-time"]
 
-        self.red_packets = {}
+        self.red_packets = OrderedDict()  # 按发出时间排序，最早的在前
         self.db = XYBotDB()
 
+        # 红包背景图只从磁盘读一次，每次发红包时复制一份
+        self.background_image = Image.open("resource/images/redpacket.png")
+        self.background_image.load()
+
     @on_text_message
     async def handle_text(self, bot: WechatAPIClient, message: dict):
         if not self.enable:
             return
 
         content = str(message["Content"]).strip()
+        if not content.startswith(("发红包", "抢红包")):  # 绝大多数消息都不是红包指令，先快速排除
+            return
+
         command = re.split(r'[\s\u2005]+', content)
 
         if not len(command):
@@ -88,7 +96,7 @@ class RedPacket(PluginBase):
         captcha, captcha_image = self._generate_captcha()
 
         # 加载红包背景图
-        background = Image.open("resource/images/redpacket.png")
+        background = self.background_image.copy()
 
         # 调整验证码图片大小
         captcha_width = 400  # 进一步增加验证码宽度
@@ -137,11 +145,12 @@ class RedPacket(PluginBase):
             "amount": amount,
             "sender": sender_wxid,
             "list": points_list,
-            "grabbed": [],
+            "grabbed": set(),
             "time": time.time(),
             "chatroom": from_wxid,
             "sender_nick": sender_nick
         }
+        self.red_packets.move_to_end(captcha)
 
         self.db.add_points(sender_wxid, -points)
         logger.info(f"用户 {sender_wxid} 发了个红包 {captcha}，总计 {points} 点积分")
@@ -180,7 +189,7 @@ class RedPacket(PluginBase):
 
         try:
             grabbed_points = self.red_packets[captcha]["list"].pop()
-            self.red_packets[captcha]["grabbed"].append(grabber_wxid)
+            self.red_packets[captcha]["grabbed"].add(grabber_wxid)
 
             grabber_nick = await bot.get_nickname(grabber_wxid)
             self.db.add_points(grabber_wxid, grabbed_points)
@@ -197,22 +206,26 @@ class RedPacket(PluginBase):
     @schedule('interval', seconds=300)
     async def check_expired_packets(self, bot: WechatAPIClient):
         logger.info("[计划任务]检查是否有超时的红包")
-        for captcha in list(self.red_packets.keys()):
-            packet = self.red_packets[captcha]
-            if time.time() - packet["time"] > self.max_time:
-                points_left = sum(packet["list"])
-                sender_wxid = packet["sender"]
-                chatroom = packet["chatroom"]
-                sender_nick = packet["sender_nick"]
-
-                self.db.add_points(sender_wxid, points_left)
-                self.red_packets.pop(captcha)
-
-                out_message = (
-                    f"-----XYBot-----\n"
-                    f"🧧发现有红包 {captcha} 超时！已归还剩余 {points_left} 积分给 {sender_nick}"
-                )
-                await bot.send_text_message(chatroom, out_message)
+        # 红包按发出时间排序，遇到第一个未超时的红包即可停止
+        now = time.time()
+        while self.red_packets:
+            captcha, packet = next(iter(self.red_packets.items()))
+            if now - packet["time"] <= self.max_time:
+                break
+
+            points_left = sum(packet["list"])
+            sender_wxid = packet["sender"]
+            chatroom = packet["chatroom"]
+            sender_nick = packet["sender_nick"]
+
+            self.db.add_points(sender_wxid, points_left)
+            self.red_packets.popitem(last=False)
+
+            out_message = (
+                f"-----XYBot-----\n"
+                f"🧧发现有红包 {captcha} 超时！已归还剩余 {points_left} 积分给 {sender_nick}"
+            )
+            await bot.send_text_message(chatroom, out_message)
 
     @staticmethod
     def _generate_captcha():
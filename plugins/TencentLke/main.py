@@ -6,6 +6,7 @@ import tomllib
 import aiohttp
 
 from WechatAPI import WechatAPIClient
+from utils.config_loader import load_toml
 from utils.decorators import *
 from utils.plugin_base import PluginBase
 
@@ -18,8 +19,7 @@ class TencentLke(PluginBase):
     def __init__(self):
         super().__init__()
 
-        with open("main_config.toml", "rb") as f:
-            config = tomllib.load(f)
+        config = load_toml("main_config.toml")
 
         self.admins = config["XYBot"]["admins"]
 
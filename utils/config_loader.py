@@ -0,0 +1,20 @@
+import copy
+import os
+import tomllib
+from functools import lru_cache
+
+
+@lru_cache(maxsize=32)
+def _parse_toml(path: str, mtime: float) -> dict:
+    """按路径和修改时间缓存解析结果，文件被修改后会重新解析"""
+    with open(path, "rb") as f:
+        return tomllib.load(f)
+
+
+def load_toml(path: str) -> dict:
+    """读取toml配置文件
+
+    多个插件共用同一个配置文件时只需解析一次，返回的是副本，调用方可以随意修改
+    """
+    path = os.path.abspath(path)
+    return copy.deepcopy(_parse_toml(path, os.path.getmtime(path)))
@@ -1,4 +1,3 @@
-from functools import wraps
 from typing import Callable, Union
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
@@ -25,16 +24,13 @@ def schedule(
     def decorator(func: Callable):
         job_id = f"{func.__module__}.{func.__qualname__}"
 
-        @wraps(func)
-        async def wrapper(self, *args, **kwargs):
-            return await func(self, *args, **kwargs)
+        # 和消息装饰器一样直接标记原函数，不再包一层协程，调度时少一次await
+        setattr(func, '_is_scheduled', True)
+        setattr(func, '_schedule_trigger', trigger)
+        setattr(func, '_schedule_args', trigger_args)
+        setattr(func, '_job_id', job_id)
 
-        setattr(wrapper, '_is_scheduled', True)
-        setattr(wrapper, '_schedule_trigger', trigger)
-        setattr(wrapper, '_schedule_args', trigger_args)
-        setattr(wrapper, '_job_id', job_id)
-
-        return wrapper
+        return func
 
     return decorator
 
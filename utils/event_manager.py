@@ -13,21 +13,25 @@ class EventManager:
             if hasattr(method, '_event_type'):
                 event_type = getattr(method, '_event_type')
                 priority = getattr(method, '_priority', 50)
-                
-                if event_type not in cls._handlers:
-                    cls._handlers[event_type] = []
-                cls._handlers[event_type].append((method, instance, priority))
+
+                handlers = cls._handlers.setdefault(event_type, [])
+                handlers.append((method, instance, priority))
                 # 按优先级排序，优先级高的在前
-                cls._handlers[event_type].sort(key=lambda x: x[2], reverse=True)
+                handlers.sort(key=lambda x: x[2], reverse=True)
 
     @classmethod
     async def emit(cls, event_type: str, *args, **kwargs) -> None:
         """触发事件"""
-        if event_type not in cls._handlers:
+        handlers = cls._handlers.get(event_type)
+        if not handlers:
             return
 
         api_client, message = args
-        for handler, instance, priority in cls._handlers[event_type]:
+        for handler, instance, priority in handlers:
+            # 插件被关闭时不调用处理函数，也就不用深拷贝消息，见PluginBase.enable
+            if not instance.enable:
+                continue
+
             # 只对 message 进行深拷贝，api_client 保持不变
             handler_args = (api_client, copy.deepcopy(message))
             new_kwargs = {k: copy.deepcopy(v) for k, v in kwargs.items()}
@@ -6,13 +6,20 @@ from .decorators import scheduler, add_job_safe, remove_job_safe
 
 
 class PluginBase(ABC):
-    """插件基类"""
+    """插件基类
+
+    Attributes:
+        enable (bool): 插件是否处理消息，一般从插件配置读取。为False时EventManager不会调用该插件的任何消息处理函数
+    """
 
     # 插件元数据
     description: str = "暂无描述"
     author: str = "未知"
     version: str = "1.0.0"
 
+    # 插件开关，EventManager分发消息时会跳过enable为False的插件
+    enable: bool = True
+
     def __init__(self):
         self.enabled = False
         self._scheduled_jobs = set()
@@ -1,3 +1,4 @@
+import asyncio
 import tomllib
 import xml.etree.ElementTree as ET
 from typing import Dict, Any
@@ -25,12 +26,56 @@ class XYBot:
         self.ignore_protection = main_config.get("XYBot", {}).get("ignore-protection", False)
 
         self.ignore_mode = main_config.get("XYBot", {}).get("ignore-mode", "")
-        self.whitelist = main_config.get("XYBot", {}).get("whitelist", [])
-        self.blacklist = main_config.get("XYBot", {}).get("blacklist", [])
+        self.whitelist = frozenset(main_config.get("XYBot", {}).get("whitelist", []))
+        self.blacklist = frozenset(main_config.get("XYBot", {}).get("blacklist", []))
 
         self.msg_db = MessageDB()
         self.key_db = KeyvalDB()
 
+        # 消息计数先累加在内存里，由后台任务定期写回数据库，关闭时再写一次
+        self._msg_count = 0
+        self._msg_count_saved = 0
+        self._msg_count_flush_interval = 10
+        self._msg_count_task = None
+
+    async def initialize(self):
+        """异步初始化，读取已保存的消息计数并启动定期写回任务"""
+        self._msg_count = int(await self.key_db.get("messages") or 0)
+        self._msg_count_saved = self._msg_count
+        self._msg_count_task = asyncio.create_task(self._flush_msg_count_loop())
+
+    async def flush_msg_count(self):
+        """把内存中的消息计数写回数据库"""
+        msg_count = self._msg_count
+        if msg_count == self._msg_count_saved:
+            return
+
+        await self.key_db.set("messages", str(msg_count))
+        # 同时更新WebUI使用的消息计数键
+        await self.key_db.set("bot:stats:message_count", str(msg_count))
+        self._msg_count_saved = msg_count
+
+    async def _flush_msg_count_loop(self):
+        """后台定时写回消息计数"""
+        while True:
+            await asyncio.sleep(self._msg_count_flush_interval)
+            try:
+                await self.flush_msg_count()
+            except Exception as e:
+                logger.error("保存消息计数失败: {}", e)
+
+    async def close(self):
+        """停止定期写回任务，并把剩余的消息计数写回数据库"""
+        if self._msg_count_task:
+            self._msg_count_task.cancel()
+            try:
+                await self._msg_count_task
+            except asyncio.CancelledError:
+                pass
+            self._msg_count_task = None
+
+        await self.flush_msg_count()
+
 
     def update_profile(self, wxid: str, nickname: str, alias: str, phone: str):
         """更新机器人信息"""
@@ -42,12 +87,8 @@ class XYBot:
     async def process_message(self, message: Dict[str, Any]):
         """处理接收到的消息"""
 
-        # 数据库消息数+1先
-        msg_count = int(await self.key_db.get("messages") or 0) + 1
-        await self.key_db.set("messages", str(msg_count))
-        
-        # 同时更新WebUI使用的消息计数键
-        await self.key_db.set("bot:stats:message_count", str(msg_count))
+        # 消息数+1先，由后台任务定期写回数据库
+        self._msg_count += 1
 
         msg_type = message.get("MsgType")
 